@@ -1,11 +1,14 @@
 import asyncio
+import concurrent
 import json
 import logging
 import time
 from asyncio import sleep
+from concurrent.futures.thread import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple
 import traceback
+from collections import OrderedDict, defaultdict
 
 import aiohttp
 from blspy import AugSchemeMPL, G1Element, G2Element, PrivateKey
@@ -32,6 +35,7 @@ from chia.protocols.pool_protocol import (
 from chia.protocols.protocol_message_types import ProtocolMessageTypes
 from chia.server.outbound_message import NodeType, make_msg
 from chia.server.ws_connection import WSChiaConnection
+from chia.types.blockchain_format.pool_target import PoolTarget
 from chia.types.blockchain_format.proof_of_space import ProofOfSpace
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.util.bech32m import decode_puzzle_hash, encode_puzzle_hash
@@ -39,6 +43,7 @@ from chia.util.config import load_config, save_config, config_path_for_filename
 from chia.util.hash import std_hash
 from chia.util.ints import uint8, uint16, uint32, uint64
 from chia.util.keychain import Keychain
+from chia.util.lru_cache import LRUCache
 from chia.wallet.derive_keys import (
     master_sk_to_farmer_sk,
     master_sk_to_pool_sk,
@@ -55,6 +60,10 @@ log = logging.getLogger(__name__)
 UPDATE_POOL_INFO_INTERVAL: int = 3600
 UPDATE_POOL_FARMER_INFO_INTERVAL: int = 300
 UPDATE_HARVESTER_CACHE_INTERVAL: int = int(30 * 60)
+# OG pool partials are submitted in the background with at most this many requests in flight
+MAX_PARTIAL_SUBMISSIONS_IN_FLIGHT: int = 32
+# Partials waiting for a free submission slot beyond this are dropped instead of queued
+MAX_PENDING_PARTIAL_SUBMISSIONS: int = 256
 
 """
 HARVESTER PROTOCOL (FARMER <-> HARVESTER)
@@ -88,21 +97,30 @@ class Farmer:
     ):
         self._root_path = root_path
         self.config = farmer_config
-        # Keep track of all sps, keyed on challenge chain signage point hash
-        self.sps: Dict[bytes32, List[farmer_protocol.NewSignagePoint]] = {}
+        # Keep track of all sps, keyed on challenge chain signage point hash and then reward chain signage point hash
+        self.sps: Dict[bytes32, Dict[bytes32, farmer_protocol.NewSignagePoint]] = {}
 
-        # Keep track of harvester plot identifier (str), target sp index, and PoSpace for each challenge
-        self.proofs_of_space: Dict[bytes32, List[Tuple[str, ProofOfSpace]]] = {}
+        # Keep track of harvester plot identifier (str) to PoSpace and its quality string for each challenge
+        self.proofs_of_space: DefaultDict[bytes32, Dict[str, Tuple[ProofOfSpace, bytes32]]] = defaultdict(dict)
 
         # Quality string to plot identifier and challenge_hash, for use with harvester.RequestSignatures
         self.quality_str_to_identifiers: Dict[bytes32, Tuple[str, bytes32, bytes32, bytes32]] = {}
 
+        # Verified quality strings, keyed on the serialized proof, challenge hash and signage point hash
+        self.quality_str_cache: LRUCache = LRUCache(1024)
+
         # number of responses to each signage point
-        self.number_of_responses: Dict[bytes32, int] = {}
+        self.number_of_responses: DefaultDict[bytes32, int] = defaultdict(int)
 
         # A dictionary of keys to time added. These keys refer to keys in the above 4 dictionaries. This is used
-        # to periodically clear the memory
-        self.cache_add_time: Dict[bytes32, uint64] = {}
+        # to periodically clear the memory. Kept in the order of the last update, see touch_cache
+        self.cache_add_time: "OrderedDict[bytes32, int]" = OrderedDict()
+
+        # Background OG pool partial submissions, referenced here so they are not garbage collected
+        self.pending_partial_submissions: Set[asyncio.Task] = set()
+
+        # Runs the BLS signing and verification for harvester responses
+        self.executor: ThreadPoolExecutor = concurrent.futures.ThreadPoolExecutor()
 
         self.cache_clear_task: asyncio.Task
         self.update_pool_state_task: asyncio.Task
@@ -117,7 +135,6 @@ class Farmer:
         self._private_keys = [master_sk_to_farmer_sk(sk) for sk in self.all_root_sks] + [
             master_sk_to_pool_sk(sk) for sk in self.all_root_sks
         ]
-
         if len(self.get_public_keys()) == 0:
             error_str = "No keys exist. Please run 'chia keys generate' or open the UI."
             raise RuntimeError(error_str)
@@ -131,9 +148,9 @@ class Farmer:
         # This is the self pooling configuration, which is only used for original self-pooled plots
         self.pool_target_encoded = pool_config["xch_target_address"]
         self.pool_target = decode_puzzle_hash(self.pool_target_encoded)
-        self.pool_sks_map: Dict = {}
-        for key in self.get_private_keys():
-            self.pool_sks_map[bytes(key.get_g1())] = key
+        self.cache_pool_target()
+        # From public key bytes to PrivateKey for all farmer and pool keys, see get_private_key
+        self.pool_sks_map: Dict[bytes, PrivateKey] = {bytes(sk.get_g1()): sk for sk in self.get_private_keys()}
 
         assert len(self.farmer_target) == 32
         assert len(self.pool_target) == 32
@@ -165,6 +182,22 @@ class Farmer:
         self.adjust_pool_difficulties_task: Optional[asyncio.Task] = None
         self.check_pool_reward_target_task: Optional[asyncio.Task] = None
 
+    def touch_cache(self, key: bytes32, now: int):
+        self.cache_add_time[key] = now
+        self.cache_add_time.move_to_end(key)
+
+    def clear_expired_cache(self, now: float):
+        # The oldest entries come first, so stop at the first one which is still fresh
+        while len(self.cache_add_time) > 0:
+            key, add_time = next(iter(self.cache_add_time.items()))
+            if now - add_time <= self.constants.SUB_SLOT_TIME_TARGET * 3:
+                break
+            self.sps.pop(key, None)
+            self.proofs_of_space.pop(key, None)
+            self.quality_str_to_identifiers.pop(key, None)
+            self.number_of_responses.pop(key, None)
+            self.cache_add_time.popitem(last=False)
+
     def is_pooling_enabled(self):
         return self.pool_url is not None and self.pool_payout_address is not None
 
@@ -175,6 +208,7 @@ class Farmer:
             self.log.info(f"Not OG pooling as 'pool_payout_address' and/or 'pool_url' are missing in your config")
             return
         self.pool_api_client = PoolApiClient(self.pool_url)
+        self.submit_partial_semaphore = asyncio.Semaphore(MAX_PARTIAL_SUBMISSIONS_IN_FLIGHT)
         await self.initialize_pooling()
         self.adjust_pool_difficulties_task = asyncio.create_task(self._periodically_adjust_pool_difficulties_task())
         self.check_pool_reward_target_task = asyncio.create_task(self._periodically_check_pool_reward_target_task())
@@ -207,6 +241,9 @@ class Farmer:
 
     def _close(self):
         self._shut_down = True
+        for task in self.pending_partial_submissions:
+            task.cancel()
+        self.executor.shutdown(wait=True)
 
     async def _await_closed(self):
         await self.cache_clear_task
@@ -215,6 +252,7 @@ class Farmer:
             await self.adjust_pool_difficulties_task
         if self.check_pool_reward_target_task is not None:
             await self.check_pool_reward_target_task
+        await asyncio.gather(*self.pending_partial_submissions, return_exceptions=True)
 
     def _set_state_changed_callback(self, callback: Callable):
         self.state_changed_callback = callback
@@ -519,6 +557,12 @@ class Farmer:
     def get_private_keys(self):
         return self._private_keys
 
+    def get_private_key(self, public_key: G1Element, key_name: str = "farmer") -> Optional[PrivateKey]:
+        sk = self.pool_sks_map.get(bytes(public_key))
+        if sk is None:
+            self.log.error(f"Don't have the private key for the {key_name} key used by harvester: {public_key}")
+        return sk
+
     def get_reward_targets(self, search_for_private_key: bool) -> Dict:
         if search_for_private_key:
             all_sks = self.keychain.get_all_private_keys()
@@ -544,6 +588,11 @@ class Farmer:
             "pool_target": self.pool_target_encoded,
         }
 
+    def cache_pool_target(self):
+        # The signed pool target only changes with the configured pool target, so serialize it once
+        self.pool_target_for_signing = PoolTarget(self.pool_target, uint32(0))
+        self.pool_target_for_signing_bytes = bytes(self.pool_target_for_signing)
+
     def set_reward_targets(self, farmer_target_encoded: Optional[str], pool_target_encoded: Optional[str]):
         config = load_config(self._root_path, "config.yaml")
         if farmer_target_encoded is not None:
@@ -553,6 +602,7 @@ class Farmer:
         if pool_target_encoded is not None:
             self.pool_target_encoded = pool_target_encoded
             self.pool_target = decode_puzzle_hash(pool_target_encoded)
+            self.cache_pool_target()
             config["pool"]["xch_target_address"] = pool_target_encoded
         save_config(self._root_path, "config.yaml", config)
 
@@ -697,17 +747,7 @@ class Farmer:
         while not self._shut_down:
             try:
                 if time_slept > self.constants.SUB_SLOT_TIME_TARGET:
-                    now = time.time()
-                    removed_keys: List[bytes32] = []
-                    for key, add_time in self.cache_add_time.items():
-                        if now - float(add_time) > self.constants.SUB_SLOT_TIME_TARGET * 3:
-                            self.sps.pop(key, None)
-                            self.proofs_of_space.pop(key, None)
-                            self.quality_str_to_identifiers.pop(key, None)
-                            self.number_of_responses.pop(key, None)
-                            removed_keys.append(key)
-                    for key in removed_keys:
-                        self.cache_add_time.pop(key, None)
+                    self.clear_expired_cache(time.time())
                     time_slept = uint64(0)
                     log.debug(
                         f"Cleared farmer cache. Num sps: {len(self.sps)} {len(self.proofs_of_space)} "
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import time
 from typing import Callable, Optional, List, Any, Dict
@@ -7,7 +8,7 @@ from blspy import AugSchemeMPL, G2Element, G1Element, PrivateKey
 
 import chia.server.ws_connection as ws
 from chia.consensus.pot_iterations import calculate_iterations_quality, calculate_sp_interval_iters
-from chia.farmer.farmer import Farmer
+from chia.farmer.farmer import MAX_PENDING_PARTIAL_SUBMISSIONS, Farmer
 from chia.farmer.pooling.og_pool_protocol import PartialPayload, SubmitPartial
 from chia.protocols import farmer_protocol, harvester_protocol
 from chia.protocols.harvester_protocol import PoolDifficulty
@@ -23,7 +24,7 @@ from chia.types.blockchain_format.pool_target import PoolTarget
 from chia.types.blockchain_format.proof_of_space import ProofOfSpace
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.util.api_decorators import api_request, peer_required
-from chia.util.ints import uint32, uint64
+from chia.util.ints import uint64
 
 
 class FarmerAPI:
@@ -35,6 +36,10 @@ class FarmerAPI:
     def _set_state_changed_callback(self, callback: Callable):
         self.farmer.state_changed_callback = callback
 
+    async def _run_bls(self, function: Callable, *args) -> Any:
+        # Signing and verification are CPU bound, keep them off the event loop
+        return await asyncio.get_running_loop().run_in_executor(self.farmer.executor, function, *args)
+
     @api_request
     @peer_required
     async def new_proof_of_space(
@@ -44,256 +49,244 @@ class FarmerAPI:
         This is a response from the harvester, for a NewChallenge. Here we check if the proof
         of space is sufficiently good, and if so, we ask for the whole proof.
         """
-        if new_proof_of_space.sp_hash not in self.farmer.number_of_responses:
-            self.farmer.number_of_responses[new_proof_of_space.sp_hash] = 0
-            self.farmer.cache_add_time[new_proof_of_space.sp_hash] = uint64(int(time.time()))
+        farmer = self.farmer
+        sp_hash = new_proof_of_space.sp_hash
+        sps_for_sp_hash = farmer.sps.get(sp_hash)
+        if sps_for_sp_hash is None:
+            farmer.log.warning(f"Received response for a signage point that we do not have {sp_hash}")
+            return None
 
         max_pos_per_sp = 5
-        if self.farmer.number_of_responses[new_proof_of_space.sp_hash] > max_pos_per_sp:
+        if farmer.number_of_responses[sp_hash] > max_pos_per_sp:
             # This will likely never happen for any farmer with less than 10% of global space
             # It's meant to make testnets more stable
-            self.farmer.log.info(
+            farmer.log.info(
                 f"Surpassed {max_pos_per_sp} PoSpace for one SP, no longer submitting PoSpace for signage point "
-                f"{new_proof_of_space.sp_hash}"
+                f"{sp_hash}"
             )
             return None
 
-        if new_proof_of_space.sp_hash not in self.farmer.sps:
-            self.farmer.log.warning(
-                f"Received response for a signage point that we do not have {new_proof_of_space.sp_hash}"
+        # Harvesters may send the same proof again, only verify it once
+        quality_key = (bytes(new_proof_of_space.proof), new_proof_of_space.challenge_hash, sp_hash)
+        computed_quality_string = farmer.quality_str_cache.get(quality_key)
+        if computed_quality_string is None:
+            computed_quality_string = new_proof_of_space.proof.verify_and_get_quality_string(
+                farmer.constants, new_proof_of_space.challenge_hash, sp_hash
             )
+            if computed_quality_string is not None:
+                farmer.quality_str_cache.put(quality_key, computed_quality_string)
+        if computed_quality_string is None:
+            farmer.log.error(f"Invalid proof of space {new_proof_of_space.proof}")
             return None
 
-        sps = self.farmer.sps[new_proof_of_space.sp_hash]
-        for sp in sps:
-            computed_quality_string = new_proof_of_space.proof.verify_and_get_quality_string(
-                self.farmer.constants,
+        farmer.number_of_responses[sp_hash] += 1
+
+        # The first signage point received for this challenge chain sp hash is the one being farmed
+        sp = next(iter(sps_for_sp_hash.values()))
+        sp_interval_iters = calculate_sp_interval_iters(farmer.constants, sp.sub_slot_iters)
+        required_iters: uint64 = calculate_iterations_quality(
+            farmer.constants.DIFFICULTY_CONSTANT_FACTOR,
+            computed_quality_string,
+            new_proof_of_space.proof.size,
+            sp.difficulty,
+            sp_hash,
+        )
+
+        # If the iters are good enough to make a block, proceed with the block making flow
+        if required_iters < sp_interval_iters:
+            # Proceed at getting the signatures for this PoSpace
+            request = harvester_protocol.RequestSignatures(
+                new_proof_of_space.plot_identifier,
                 new_proof_of_space.challenge_hash,
-                new_proof_of_space.sp_hash,
+                sp_hash,
+                [sp.challenge_chain_sp, sp.reward_chain_sp],
             )
-            if computed_quality_string is None:
-                self.farmer.log.error(f"Invalid proof of space {new_proof_of_space.proof}")
-                return None
-
-            self.farmer.number_of_responses[new_proof_of_space.sp_hash] += 1
 
-            required_iters: uint64 = calculate_iterations_quality(
-                self.farmer.constants.DIFFICULTY_CONSTANT_FACTOR,
+            farmer.proofs_of_space[sp_hash][new_proof_of_space.plot_identifier] = (
+                new_proof_of_space.proof,
                 computed_quality_string,
-                new_proof_of_space.proof.size,
-                sp.difficulty,
-                new_proof_of_space.sp_hash,
             )
+            now = int(time.time())
+            farmer.touch_cache(sp_hash, now)
+            farmer.quality_str_to_identifiers[computed_quality_string] = (
+                new_proof_of_space.plot_identifier,
+                new_proof_of_space.challenge_hash,
+                sp_hash,
+                peer.peer_node_id,
+            )
+            farmer.touch_cache(computed_quality_string, now)
 
-            # If the iters are good enough to make a block, proceed with the block making flow
-            if required_iters < calculate_sp_interval_iters(self.farmer.constants, sp.sub_slot_iters):
-                # Proceed at getting the signatures for this PoSpace
-                request = harvester_protocol.RequestSignatures(
-                    new_proof_of_space.plot_identifier,
-                    new_proof_of_space.challenge_hash,
-                    new_proof_of_space.sp_hash,
-                    [sp.challenge_chain_sp, sp.reward_chain_sp],
-                )
+            await peer.send_message(make_msg(ProtocolMessageTypes.request_signatures, request))
 
-                if new_proof_of_space.sp_hash not in self.farmer.proofs_of_space:
-                    self.farmer.proofs_of_space[new_proof_of_space.sp_hash] = []
-                self.farmer.proofs_of_space[new_proof_of_space.sp_hash].append(
-                    (
-                        new_proof_of_space.plot_identifier,
-                        new_proof_of_space.proof,
-                    )
-                )
-                self.farmer.cache_add_time[new_proof_of_space.sp_hash] = uint64(int(time.time()))
-                self.farmer.quality_str_to_identifiers[computed_quality_string] = (
-                    new_proof_of_space.plot_identifier,
-                    new_proof_of_space.challenge_hash,
-                    new_proof_of_space.sp_hash,
-                    peer.peer_node_id,
-                )
-                self.farmer.cache_add_time[computed_quality_string] = uint64(int(time.time()))
-
-                await peer.send_message(make_msg(ProtocolMessageTypes.request_signatures, request))
-
-            p2_singleton_puzzle_hash = new_proof_of_space.proof.pool_contract_puzzle_hash
-            if p2_singleton_puzzle_hash is not None:
-                # Otherwise, send the proof of space to the pool
-                # When we win a block, we also send the partial to the pool
-                if p2_singleton_puzzle_hash not in self.farmer.pool_state:
-                    self.farmer.log.info(f"Did not find pool info for {p2_singleton_puzzle_hash}")
-                    return
-                pool_state_dict: Dict = self.farmer.pool_state[p2_singleton_puzzle_hash]
-                pool_url = pool_state_dict["pool_config"].pool_url
-                if pool_url == "":
-                    return
-
-                if pool_state_dict["current_difficulty"] is None:
-                    self.farmer.log.warning(
-                        f"No pool specific difficulty has been set for {p2_singleton_puzzle_hash}, "
-                        f"check communication with the pool, skipping this partial to {pool_url}."
-                    )
-                    return
-
-                required_iters = calculate_iterations_quality(
-                    self.farmer.constants.DIFFICULTY_CONSTANT_FACTOR,
-                    computed_quality_string,
-                    new_proof_of_space.proof.size,
-                    pool_state_dict["current_difficulty"],
-                    new_proof_of_space.sp_hash,
-                )
-                if required_iters >= calculate_sp_interval_iters(
-                    self.farmer.constants, self.farmer.constants.POOL_SUB_SLOT_ITERS
-                ):
-                    self.farmer.log.info(
-                        f"Proof of space not good enough for pool {pool_url}: {pool_state_dict['current_difficulty']}"
-                    )
-                    return
+        p2_singleton_puzzle_hash = new_proof_of_space.proof.pool_contract_puzzle_hash
+        if p2_singleton_puzzle_hash is not None:
+            # Otherwise, send the proof of space to the pool
+            # When we win a block, we also send the partial to the pool
+            if p2_singleton_puzzle_hash not in farmer.pool_state:
+                farmer.log.info(f"Did not find pool info for {p2_singleton_puzzle_hash}")
+                return
+            pool_state_dict: Dict = farmer.pool_state[p2_singleton_puzzle_hash]
+            pool_url = pool_state_dict["pool_config"].pool_url
+            if pool_url == "":
+                return
 
-                authentication_token_timeout = pool_state_dict["authentication_token_timeout"]
-                if authentication_token_timeout is None:
-                    self.farmer.log.warning(
-                        f"No pool specific authentication_token_timeout has been set for {p2_singleton_puzzle_hash}"
-                        f", check communication with the pool."
-                    )
-                    return
-
-                # Submit partial to pool
-                is_eos = new_proof_of_space.signage_point_index == 0
-
-                payload = PostPartialPayload(
-                    pool_state_dict["pool_config"].launcher_id,
-                    get_current_authentication_token(authentication_token_timeout),
-                    new_proof_of_space.proof,
-                    new_proof_of_space.sp_hash,
-                    is_eos,
-                    peer.peer_node_id,
+            if pool_state_dict["current_difficulty"] is None:
+                farmer.log.warning(
+                    f"No pool specific difficulty has been set for {p2_singleton_puzzle_hash}, "
+                    f"check communication with the pool, skipping this partial to {pool_url}."
                 )
+                return
 
-                # The plot key is 2/2 so we need the harvester's half of the signature
-                m_to_sign = payload.get_hash()
-                request = harvester_protocol.RequestSignatures(
-                    new_proof_of_space.plot_identifier,
-                    new_proof_of_space.challenge_hash,
-                    new_proof_of_space.sp_hash,
-                    [m_to_sign],
+            required_iters = calculate_iterations_quality(
+                farmer.constants.DIFFICULTY_CONSTANT_FACTOR,
+                computed_quality_string,
+                new_proof_of_space.proof.size,
+                pool_state_dict["current_difficulty"],
+                sp_hash,
+            )
+            if required_iters >= farmer.iters_limit:
+                farmer.log.info(
+                    f"Proof of space not good enough for pool {pool_url}: {pool_state_dict['current_difficulty']}"
                 )
-                response: Any = await peer.request_signatures(request)
-                if not isinstance(response, harvester_protocol.RespondSignatures):
-                    self.farmer.log.error(f"Invalid response from harvester: {response}")
-                    return
-
-                assert len(response.message_signatures) == 1
-
-                plot_signature: Optional[G2Element] = None
-                for sk in self.farmer.get_private_keys():
-                    pk = sk.get_g1()
-                    if pk == response.farmer_pk:
-                        agg_pk = ProofOfSpace.generate_plot_public_key(response.local_pk, pk, True)
-                        assert agg_pk == new_proof_of_space.proof.plot_public_key
-                        sig_farmer = AugSchemeMPL.sign(sk, m_to_sign, agg_pk)
-                        taproot_sk: PrivateKey = ProofOfSpace.generate_taproot_sk(response.local_pk, pk)
-                        taproot_sig: G2Element = AugSchemeMPL.sign(taproot_sk, m_to_sign, agg_pk)
-
-                        plot_signature = AugSchemeMPL.aggregate(
-                            [sig_farmer, response.message_signatures[0][1], taproot_sig]
-                        )
-                        assert AugSchemeMPL.verify(agg_pk, m_to_sign, plot_signature)
-                authentication_pk = pool_state_dict["pool_config"].authentication_public_key
-                if bytes(authentication_pk) is None:
-                    self.farmer.log.error(f"No authentication sk for {authentication_pk}")
-                    return
-                authentication_sk: PrivateKey = self.farmer.authentication_keys[bytes(authentication_pk)]
-                authentication_signature = AugSchemeMPL.sign(authentication_sk, m_to_sign)
-
-                assert plot_signature is not None
-
-                agg_sig: G2Element = AugSchemeMPL.aggregate([plot_signature, authentication_signature])
-
-                post_partial_request: PostPartialRequest = PostPartialRequest(payload, agg_sig)
-                post_partial_body = json.dumps(post_partial_request.to_json_dict())
-                self.farmer.log.info(
-                    f"Submitting partial for {post_partial_request.payload.launcher_id.hex()} to {pool_url}"
+                return
+
+            authentication_token_timeout = pool_state_dict["authentication_token_timeout"]
+            if authentication_token_timeout is None:
+                farmer.log.warning(
+                    f"No pool specific authentication_token_timeout has been set for {p2_singleton_puzzle_hash}"
+                    f", check communication with the pool."
                 )
-                pool_state_dict["points_found_since_start"] += pool_state_dict["current_difficulty"]
-                pool_state_dict["points_found_24h"].append((time.time(), pool_state_dict["current_difficulty"]))
-                headers = {
-                    "content-type": "application/json;",
-                }
-                try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.post(f"{pool_url}/partial", data=post_partial_body, headers=headers) as resp:
-                            if resp.ok:
-                                pool_response: Dict = json.loads(await resp.text())
-                                self.farmer.log.info(f"Pool response: {pool_response}")
-                                if "error_code" in pool_response:
-                                    self.farmer.log.error(
-                                        f"Error in pooling: "
-                                        f"{pool_response['error_code'], pool_response['error_message']}"
-                                    )
-                                    pool_state_dict["pool_errors_24h"].append(pool_response)
-                                    if pool_response["error_code"] == PoolErrorCode.PROOF_NOT_GOOD_ENOUGH.value:
-                                        self.farmer.log.error(
-                                            "Partial not good enough, forcing pool farmer update to "
-                                            "get our current difficulty."
-                                        )
-                                        pool_state_dict["next_farmer_update"] = 0
-                                        await self.farmer.update_pool_state()
-                                else:
-                                    new_difficulty = pool_response["new_difficulty"]
-                                    pool_state_dict["points_acknowledged_since_start"] += new_difficulty
-                                    pool_state_dict["points_acknowledged_24h"].append((time.time(), new_difficulty))
-                                    pool_state_dict["current_difficulty"] = new_difficulty
-                            else:
-                                self.farmer.log.error(f"Error sending partial to {pool_url}, {resp.status}")
-                except Exception as e:
-                    self.farmer.log.error(f"Error connecting to pool: {e}")
-                    return
+                return
+
+            # Submit partial to pool
+            is_eos = new_proof_of_space.signage_point_index == 0
+
+            payload = PostPartialPayload(
+                pool_state_dict["pool_config"].launcher_id,
+                get_current_authentication_token(authentication_token_timeout),
+                new_proof_of_space.proof,
+                sp_hash,
+                is_eos,
+                peer.peer_node_id,
+            )
+
+            # The plot key is 2/2 so we need the harvester's half of the signature
+            m_to_sign = payload.get_hash()
+            request = harvester_protocol.RequestSignatures(
+                new_proof_of_space.plot_identifier,
+                new_proof_of_space.challenge_hash,
+                sp_hash,
+                [m_to_sign],
+            )
+            response: Any = await peer.request_signatures(request)
+            if not isinstance(response, harvester_protocol.RespondSignatures):
+                farmer.log.error(f"Invalid response from harvester: {response}")
+                return
+
+            assert len(response.message_signatures) == 1
 
+            sk = farmer.get_private_key(response.farmer_pk)
+            if sk is None:
                 return
+            authentication_pk = pool_state_dict["pool_config"].authentication_public_key
+            authentication_sk: Optional[PrivateKey] = farmer.authentication_keys.get(bytes(authentication_pk))
+            if authentication_sk is None:
+                farmer.log.error(f"No authentication sk for {authentication_pk}")
+                return
+            agg_pk = ProofOfSpace.generate_plot_public_key(response.local_pk, response.farmer_pk, True)
+            assert agg_pk == new_proof_of_space.proof.plot_public_key
+            taproot_sk: PrivateKey = ProofOfSpace.generate_taproot_sk(response.local_pk, response.farmer_pk)
+            sig_farmer, taproot_sig, authentication_signature = await asyncio.gather(
+                self._run_bls(AugSchemeMPL.sign, sk, m_to_sign, agg_pk),
+                self._run_bls(AugSchemeMPL.sign, taproot_sk, m_to_sign, agg_pk),
+                self._run_bls(AugSchemeMPL.sign, authentication_sk, m_to_sign),
+            )
 
-            pool_public_key = new_proof_of_space.proof.pool_public_key
-            if pool_public_key is not None and self.farmer.is_pooling_enabled():
-                await self.process_new_proof_of_space_for_og_pool(
-                    new_proof_of_space,
-                    peer,
-                    pool_public_key,
-                    computed_quality_string
-                )
+            plot_signature: G2Element = AugSchemeMPL.aggregate(
+                [sig_farmer, response.message_signatures[0][1], taproot_sig]
+            )
+            assert await self._run_bls(AugSchemeMPL.verify, agg_pk, m_to_sign, plot_signature)
+
+            agg_sig: G2Element = AugSchemeMPL.aggregate([plot_signature, authentication_signature])
+
+            post_partial_request: PostPartialRequest = PostPartialRequest(payload, agg_sig)
+            post_partial_body = json.dumps(post_partial_request.to_json_dict())
+            farmer.log.info(
+                f"Submitting partial for {post_partial_request.payload.launcher_id.hex()} to {pool_url}"
+            )
+            pool_state_dict["points_found_since_start"] += pool_state_dict["current_difficulty"]
+            pool_state_dict["points_found_24h"].append((time.time(), pool_state_dict["current_difficulty"]))
+            headers = {
+                "content-type": "application/json;",
+            }
+            try:
+                async with aiohttp.ClientSession() as session:
+                    async with session.post(f"{pool_url}/partial", data=post_partial_body, headers=headers) as resp:
+                        if resp.ok:
+                            pool_response: Dict = json.loads(await resp.text())
+                            farmer.log.info(f"Pool response: {pool_response}")
+                            if "error_code" in pool_response:
+                                farmer.log.error(
+                                    f"Error in pooling: "
+                                    f"{pool_response['error_code'], pool_response['error_message']}"
+                                )
+                                pool_state_dict["pool_errors_24h"].append(pool_response)
+                                if pool_response["error_code"] == PoolErrorCode.PROOF_NOT_GOOD_ENOUGH.value:
+                                    farmer.log.error(
+                                        "Partial not good enough, forcing pool farmer update to "
+                                        "get our current difficulty."
+                                    )
+                                    pool_state_dict["next_farmer_update"] = 0
+                                    await farmer.update_pool_state()
+                            else:
+                                new_difficulty = pool_response["new_difficulty"]
+                                pool_state_dict["points_acknowledged_since_start"] += new_difficulty
+                                pool_state_dict["points_acknowledged_24h"].append((time.time(), new_difficulty))
+                                pool_state_dict["current_difficulty"] = new_difficulty
+                        else:
+                            farmer.log.error(f"Error sending partial to {pool_url}, {resp.status}")
+            except Exception as e:
+                farmer.log.error(f"Error connecting to pool: {e}")
+                return
 
             return
 
+        pool_public_key = new_proof_of_space.proof.pool_public_key
+        if pool_public_key is not None and farmer.is_pooling_enabled():
+            await self.process_new_proof_of_space_for_og_pool(
+                new_proof_of_space,
+                peer,
+                pool_public_key,
+                computed_quality_string
+            )
+
     @api_request
     async def respond_signatures(self, response: harvester_protocol.RespondSignatures):
         """
         There are two cases: receiving signatures for sps, or receiving signatures for the block.
         """
-        if response.sp_hash not in self.farmer.sps:
-            self.farmer.log.warning(f"Do not have challenge hash {response.challenge_hash}")
+        farmer = self.farmer
+        sps = farmer.sps.get(response.sp_hash)
+        if sps is None:
+            farmer.log.warning(f"Do not have challenge hash {response.challenge_hash}")
             return None
         is_sp_signatures: bool = False
-        sps = self.farmer.sps[response.sp_hash]
-        signage_point_index = sps[0].signage_point_index
-        found_sp_hash_debug = False
-        for sp_candidate in sps:
-            if response.sp_hash == response.message_signatures[0][0]:
-                found_sp_hash_debug = True
-                if sp_candidate.reward_chain_sp == response.message_signatures[1][0]:
-                    is_sp_signatures = True
-        if found_sp_hash_debug:
+        signage_point_index = next(iter(sps.values())).signage_point_index
+        if response.sp_hash == response.message_signatures[0][0]:
+            is_sp_signatures = response.message_signatures[1][0] in sps
             assert is_sp_signatures
 
-        pospace = None
-        for plot_identifier, candidate_pospace in self.farmer.proofs_of_space[response.sp_hash]:
-            if plot_identifier == response.plot_identifier:
-                pospace = candidate_pospace
-        assert pospace is not None
+        pospace_and_quality = farmer.proofs_of_space[response.sp_hash].get(response.plot_identifier)
+        assert pospace_and_quality is not None
+        # The proof was verified and its quality string computed when it arrived in new_proof_of_space
+        pospace, computed_quality_string = pospace_and_quality
         include_taproot: bool = pospace.pool_contract_puzzle_hash is not None
 
-        computed_quality_string = pospace.verify_and_get_quality_string(
-            self.farmer.constants, response.challenge_hash, response.sp_hash
-        )
-        if computed_quality_string is None:
-            self.farmer.log.warning(f"Have invalid PoSpace {pospace}")
+        sk = farmer.get_private_key(response.farmer_pk)
+        if sk is None:
             return None
+        agg_pk = ProofOfSpace.generate_plot_public_key(response.local_pk, response.farmer_pk, include_taproot)
+        assert agg_pk == pospace.plot_public_key
 
         if is_sp_signatures:
             (
@@ -301,116 +294,126 @@ class FarmerAPI:
                 challenge_chain_sp_harv_sig,
             ) = response.message_signatures[0]
             reward_chain_sp, reward_chain_sp_harv_sig = response.message_signatures[1]
-            for sk in self.farmer.get_private_keys():
-                pk = sk.get_g1()
-                if pk == response.farmer_pk:
-                    agg_pk = ProofOfSpace.generate_plot_public_key(response.local_pk, pk, include_taproot)
-                    assert agg_pk == pospace.plot_public_key
-                    if include_taproot:
-                        taproot_sk: PrivateKey = ProofOfSpace.generate_taproot_sk(response.local_pk, pk)
-                        taproot_share_cc_sp: G2Element = AugSchemeMPL.sign(taproot_sk, challenge_chain_sp, agg_pk)
-                        taproot_share_rc_sp: G2Element = AugSchemeMPL.sign(taproot_sk, reward_chain_sp, agg_pk)
-                    else:
-                        taproot_share_cc_sp = G2Element()
-                        taproot_share_rc_sp = G2Element()
-                    farmer_share_cc_sp = AugSchemeMPL.sign(sk, challenge_chain_sp, agg_pk)
-                    agg_sig_cc_sp = AugSchemeMPL.aggregate(
-                        [challenge_chain_sp_harv_sig, farmer_share_cc_sp, taproot_share_cc_sp]
-                    )
-                    assert AugSchemeMPL.verify(agg_pk, challenge_chain_sp, agg_sig_cc_sp)
+            signing_keys: List[PrivateKey] = [sk]
+            if include_taproot:
+                signing_keys.append(ProofOfSpace.generate_taproot_sk(response.local_pk, response.farmer_pk))
+            # The farmer and taproot shares are signed concurrently
+            shares = await asyncio.gather(
+                *[
+                    self._run_bls(AugSchemeMPL.sign, key, message, agg_pk)
+                    for key in signing_keys
+                    for message in (challenge_chain_sp, reward_chain_sp)
+                ]
+            )
+            farmer_share_cc_sp, farmer_share_rc_sp = shares[0], shares[1]
+            if include_taproot:
+                taproot_share_cc_sp, taproot_share_rc_sp = shares[2], shares[3]
+            else:
+                taproot_share_cc_sp = G2Element()
+                taproot_share_rc_sp = G2Element()
+            agg_sig_cc_sp = AugSchemeMPL.aggregate(
+                [challenge_chain_sp_harv_sig, farmer_share_cc_sp, taproot_share_cc_sp]
+            )
 
-                    # This means it passes the sp filter
-                    farmer_share_rc_sp = AugSchemeMPL.sign(sk, reward_chain_sp, agg_pk)
-                    agg_sig_rc_sp = AugSchemeMPL.aggregate(
-                        [reward_chain_sp_harv_sig, farmer_share_rc_sp, taproot_share_rc_sp]
-                    )
-                    assert AugSchemeMPL.verify(agg_pk, reward_chain_sp, agg_sig_rc_sp)
-
-                    if pospace.pool_public_key is not None:
-                        assert pospace.pool_contract_puzzle_hash is None
-                        pool_pk = bytes(pospace.pool_public_key)
-                        if pool_pk not in self.farmer.pool_sks_map:
-                            self.farmer.log.error(
-                                f"Don't have the private key for the pool key used by harvester: {pool_pk.hex()}"
-                            )
-                            return None
-
-                        pool_target: Optional[PoolTarget] = PoolTarget(self.farmer.pool_target, uint32(0))
-                        assert pool_target is not None
-                        pool_target_signature: Optional[G2Element] = AugSchemeMPL.sign(
-                            self.farmer.pool_sks_map[pool_pk], bytes(pool_target)
-                        )
-                    else:
-                        assert pospace.pool_contract_puzzle_hash is not None
-                        pool_target = None
-                        pool_target_signature = None
-
-                    request = farmer_protocol.DeclareProofOfSpace(
-                        response.challenge_hash,
-                        challenge_chain_sp,
-                        signage_point_index,
-                        reward_chain_sp,
-                        pospace,
-                        agg_sig_cc_sp,
-                        agg_sig_rc_sp,
-                        self.farmer.farmer_target,
-                        pool_target,
-                        pool_target_signature,
-                    )
-                    self.farmer.state_changed("proof", {"proof": request, "passed_filter": True})
-                    msg = make_msg(ProtocolMessageTypes.declare_proof_of_space, request)
-                    await self.farmer.server.send_to_all([msg], NodeType.FULL_NODE)
+            # This means it passes the sp filter
+            agg_sig_rc_sp = AugSchemeMPL.aggregate(
+                [reward_chain_sp_harv_sig, farmer_share_rc_sp, taproot_share_rc_sp]
+            )
+            # Verifies the combined harvester + farmer (+ taproot) signatures, which is the only local check of the
+            # harvester's shares. Like the other verify asserts in this module it is stripped entirely under -O,
+            # in which case a bad harvester share is forwarded unchecked and only rejected by the full node
+            assert await self._run_bls(
+                AugSchemeMPL.aggregate_verify,
+                [agg_pk, agg_pk],
+                [challenge_chain_sp, reward_chain_sp],
+                AugSchemeMPL.aggregate([agg_sig_cc_sp, agg_sig_rc_sp]),
+            )
+
+            if pospace.pool_public_key is not None:
+                assert pospace.pool_contract_puzzle_hash is None
+                pool_sk = farmer.get_private_key(pospace.pool_public_key, "pool")
+                if pool_sk is None:
                     return None
 
+                pool_target: Optional[PoolTarget] = farmer.pool_target_for_signing
+                pool_target_signature: Optional[G2Element] = await self._run_bls(
+                    AugSchemeMPL.sign, pool_sk, farmer.pool_target_for_signing_bytes
+                )
+            else:
+                assert pospace.pool_contract_puzzle_hash is not None
+                pool_target = None
+                pool_target_signature = None
+
+            request = farmer_protocol.DeclareProofOfSpace(
+                response.challenge_hash,
+                challenge_chain_sp,
+                signage_point_index,
+                reward_chain_sp,
+                pospace,
+                agg_sig_cc_sp,
+                agg_sig_rc_sp,
+                farmer.farmer_target,
+                pool_target,
+                pool_target_signature,
+            )
+            farmer.state_changed("proof", {"proof": request, "passed_filter": True})
+            msg = make_msg(ProtocolMessageTypes.declare_proof_of_space, request)
+            await farmer.server.send_to_all([msg], NodeType.FULL_NODE)
+            return None
+
         else:
             # This is a response with block signatures
-            for sk in self.farmer.get_private_keys():
-                (
-                    foliage_block_data_hash,
-                    foliage_sig_harvester,
-                ) = response.message_signatures[0]
-                (
-                    foliage_transaction_block_hash,
+            (
+                foliage_block_data_hash,
+                foliage_sig_harvester,
+            ) = response.message_signatures[0]
+            (
+                foliage_transaction_block_hash,
+                foliage_transaction_block_sig_harvester,
+            ) = response.message_signatures[1]
+            signing_keys = [sk]
+            if include_taproot:
+                signing_keys.append(ProofOfSpace.generate_taproot_sk(response.local_pk, response.farmer_pk))
+            # The farmer and taproot signatures are signed concurrently
+            foliage_sigs = await asyncio.gather(
+                *[
+                    self._run_bls(AugSchemeMPL.sign, key, message, agg_pk)
+                    for key in signing_keys
+                    for message in (foliage_block_data_hash, foliage_transaction_block_hash)
+                ]
+            )
+            foliage_sig_farmer, foliage_transaction_block_sig_farmer = foliage_sigs[0], foliage_sigs[1]
+            if include_taproot:
+                foliage_sig_taproot, foliage_transaction_block_sig_taproot = foliage_sigs[2], foliage_sigs[3]
+            else:
+                foliage_sig_taproot = G2Element()
+                foliage_transaction_block_sig_taproot = G2Element()
+
+            foliage_agg_sig = AugSchemeMPL.aggregate(
+                [foliage_sig_harvester, foliage_sig_farmer, foliage_sig_taproot]
+            )
+            foliage_block_agg_sig = AugSchemeMPL.aggregate(
+                [
                     foliage_transaction_block_sig_harvester,
-                ) = response.message_signatures[1]
-                pk = sk.get_g1()
-                if pk == response.farmer_pk:
-                    agg_pk = ProofOfSpace.generate_plot_public_key(response.local_pk, pk, include_taproot)
-                    assert agg_pk == pospace.plot_public_key
-                    if include_taproot:
-                        taproot_sk = ProofOfSpace.generate_taproot_sk(response.local_pk, pk)
-                        foliage_sig_taproot: G2Element = AugSchemeMPL.sign(taproot_sk, foliage_block_data_hash, agg_pk)
-                        foliage_transaction_block_sig_taproot: G2Element = AugSchemeMPL.sign(
-                            taproot_sk, foliage_transaction_block_hash, agg_pk
-                        )
-                    else:
-                        foliage_sig_taproot = G2Element()
-                        foliage_transaction_block_sig_taproot = G2Element()
-
-                    foliage_sig_farmer = AugSchemeMPL.sign(sk, foliage_block_data_hash, agg_pk)
-                    foliage_transaction_block_sig_farmer = AugSchemeMPL.sign(sk, foliage_transaction_block_hash, agg_pk)
-
-                    foliage_agg_sig = AugSchemeMPL.aggregate(
-                        [foliage_sig_harvester, foliage_sig_farmer, foliage_sig_taproot]
-                    )
-                    foliage_block_agg_sig = AugSchemeMPL.aggregate(
-                        [
-                            foliage_transaction_block_sig_harvester,
-                            foliage_transaction_block_sig_farmer,
-                            foliage_transaction_block_sig_taproot,
-                        ]
-                    )
-                    assert AugSchemeMPL.verify(agg_pk, foliage_block_data_hash, foliage_agg_sig)
-                    assert AugSchemeMPL.verify(agg_pk, foliage_transaction_block_hash, foliage_block_agg_sig)
+                    foliage_transaction_block_sig_farmer,
+                    foliage_transaction_block_sig_taproot,
+                ]
+            )
+            assert await self._run_bls(
+                AugSchemeMPL.aggregate_verify,
+                [agg_pk, agg_pk],
+                [foliage_block_data_hash, foliage_transaction_block_hash],
+                AugSchemeMPL.aggregate([foliage_agg_sig, foliage_block_agg_sig]),
+            )
 
-                    request_to_nodes = farmer_protocol.SignedValues(
-                        computed_quality_string,
-                        foliage_agg_sig,
-                        foliage_block_agg_sig,
-                    )
+            request_to_nodes = farmer_protocol.SignedValues(
+                computed_quality_string,
+                foliage_agg_sig,
+                foliage_block_agg_sig,
+            )
 
-                    msg = make_msg(ProtocolMessageTypes.signed_values, request_to_nodes)
-                    await self.farmer.server.send_to_all([msg], NodeType.FULL_NODE)
+            msg = make_msg(ProtocolMessageTypes.signed_values, request_to_nodes)
+            await farmer.server.send_to_all([msg], NodeType.FULL_NODE)
 
     """
     FARMER PROTOCOL (FARMER <-> FULL NODE)
@@ -455,14 +458,13 @@ class FarmerAPI:
 
         msg = make_msg(ProtocolMessageTypes.new_signage_point_harvester, message)
         await self.farmer.server.send_to_all([msg], NodeType.HARVESTER)
-        if new_signage_point.challenge_chain_sp not in self.farmer.sps:
-            self.farmer.sps[new_signage_point.challenge_chain_sp] = []
-        if new_signage_point in self.farmer.sps[new_signage_point.challenge_chain_sp]:
+        sps = self.farmer.sps.setdefault(new_signage_point.challenge_chain_sp, {})
+        if new_signage_point.reward_chain_sp in sps:
             self.farmer.log.debug(f"Duplicate signage point {new_signage_point.signage_point_index}")
             return
 
-        self.farmer.sps[new_signage_point.challenge_chain_sp].append(new_signage_point)
-        self.farmer.cache_add_time[new_signage_point.challenge_chain_sp] = uint64(int(time.time()))
+        sps[new_signage_point.reward_chain_sp] = new_signage_point
+        self.farmer.touch_cache(new_signage_point.challenge_chain_sp, int(time.time()))
         self.farmer.state_changed("new_signage_point", {"sp_hash": new_signage_point.challenge_chain_sp})
 
     @api_request
@@ -528,6 +530,10 @@ class FarmerAPI:
             )
             return
 
+        pool_sk: Optional[PrivateKey] = self.farmer.get_private_key(pool_public_key, "pool")
+        if pool_sk is None:
+            return
+
         # Submit partial to pool
         is_eos = new_proof_of_space.signage_point_index == 0
         payload = PartialPayload(
@@ -552,42 +558,61 @@ class FarmerAPI:
 
         assert len(response.message_signatures) == 1
 
-        plot_signature: Optional[G2Element] = None
-        for sk in self.farmer.get_private_keys():
-            pk = sk.get_g1()
-            if pk == response.farmer_pk:
-                agg_pk = ProofOfSpace.generate_plot_public_key(response.local_pk, pk)
-                assert agg_pk == new_proof_of_space.proof.plot_public_key
-                sig_farmer = AugSchemeMPL.sign(sk, m_to_sign, agg_pk)
-                plot_signature = AugSchemeMPL.aggregate([sig_farmer, response.message_signatures[0][1]])
-                assert AugSchemeMPL.verify(agg_pk, m_to_sign, plot_signature)
-        pool_sk = self.farmer.pool_sks_map[bytes(pool_public_key)]
-        authentication_signature = AugSchemeMPL.sign(pool_sk, m_to_sign)
-
-        assert plot_signature is not None
+        sk = self.farmer.get_private_key(response.farmer_pk)
+        if sk is None:
+            return
+        agg_pk = ProofOfSpace.generate_plot_public_key(response.local_pk, response.farmer_pk)
+        assert agg_pk == new_proof_of_space.proof.plot_public_key
+        sig_farmer, authentication_signature = await asyncio.gather(
+            self._run_bls(AugSchemeMPL.sign, sk, m_to_sign, agg_pk),
+            self._run_bls(AugSchemeMPL.sign, pool_sk, m_to_sign),
+        )
+        plot_signature: G2Element = AugSchemeMPL.aggregate([sig_farmer, response.message_signatures[0][1]])
+        assert await self._run_bls(AugSchemeMPL.verify, agg_pk, m_to_sign, plot_signature)
+
         agg_sig: G2Element = AugSchemeMPL.aggregate([plot_signature, authentication_signature])
 
         submit_partial = SubmitPartial(payload, agg_sig, og_pool_state.difficulty)
         self.farmer.log.debug("Submitting partial to OG pool ..")
         og_pool_state.last_partial_submit_timestamp = time.time()
+        pending_submissions = self.farmer.pending_partial_submissions
+        if len(pending_submissions) >= MAX_PENDING_PARTIAL_SUBMISSIONS:
+            # The pool is not keeping up, a partial that waits this long would be stale anyway
+            self.farmer.log.warning(
+                f"{len(pending_submissions)} partials are still waiting to be submitted to the OG pool, "
+                "dropping this one"
+            )
+            return
+        # Do not hold up the harvester connection while waiting on the pool
+        task = asyncio.create_task(self.submit_partial_to_og_pool(submit_partial))
+        pending_submissions.add(task)
+        task.add_done_callback(pending_submissions.discard)
+
+    async def submit_partial_to_og_pool(self, submit_partial: SubmitPartial):
+        og_pool_state = self.farmer.og_pool_state
         submit_partial_response: Dict
+        async with self.farmer.submit_partial_semaphore:
+            try:
+                submit_partial_response = await self.farmer.pool_api_client.submit_partial(submit_partial)
+            except Exception as e:
+                self.farmer.log.error(f"Error submitting partial to OG pool: {e}")
+                return
         try:
-            submit_partial_response = await self.farmer.pool_api_client.submit_partial(submit_partial)
-        except Exception as e:
-            self.farmer.log.error(f"Error submitting partial to OG pool: {e}")
-            return
-        self.farmer.log.debug(f"OG pool response: {submit_partial_response}")
-        if "error_code" in submit_partial_response:
-            if submit_partial_response["error_code"] == 5:
-                self.farmer.log.info(
-                    "Local OG pool difficulty too low, adjusting to OG pool difficulty "
-                    f"({submit_partial_response['current_difficulty']})"
-                )
-                og_pool_state.difficulty = uint64(submit_partial_response["current_difficulty"])
+            self.farmer.log.debug(f"OG pool response: {submit_partial_response}")
+            if "error_code" in submit_partial_response:
+                if submit_partial_response["error_code"] == 5:
+                    self.farmer.log.info(
+                        "Local OG pool difficulty too low, adjusting to OG pool difficulty "
+                        f"({submit_partial_response['current_difficulty']})"
+                    )
+                    og_pool_state.difficulty = uint64(submit_partial_response["current_difficulty"])
+                else:
+                    self.farmer.log.error(
+                        "Error in OG pooling: "
+                        f"{submit_partial_response['error_code'], submit_partial_response['error_message']}"
+                    )
             else:
-                self.farmer.log.error(
-                    f"Error in OG pooling: {submit_partial_response['error_code'], submit_partial_response['error_message']}"
-                )
-        else:
-            self.farmer.log.info("The partial submitted to the OG pool was accepted")
-            og_pool_state.difficulty = uint64(submit_partial_response["current_difficulty"])
+                self.farmer.log.info("The partial submitted to the OG pool was accepted")
+                og_pool_state.difficulty = uint64(submit_partial_response["current_difficulty"])
+        except Exception as e:
+            self.farmer.log.error(f"Error handling the OG pool response {submit_partial_response}: {e}")
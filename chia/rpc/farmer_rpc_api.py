@@ -49,9 +49,10 @@ class FarmerRpcApi:
     async def get_signage_point(self, request: Dict) -> Dict:
         sp_hash = hexstr_to_bytes(request["sp_hash"])
         for _, sps in self.service.sps.items():
-            for sp in sps:
+            for sp in sps.values():
                 if sp.challenge_chain_sp == sp_hash:
-                    pospaces = self.service.proofs_of_space.get(sp.challenge_chain_sp, [])
+                    proofs = self.service.proofs_of_space.get(sp.challenge_chain_sp, {})
+                    pospaces = [(plot_identifier, pospace) for plot_identifier, (pospace, _) in proofs.items()]
                     return {
                         "signage_point": {
                             "challenge_hash": sp.challenge_hash,
@@ -68,8 +69,9 @@ class FarmerRpcApi:
     async def get_signage_points(self, _: Dict) -> Dict:
         result: List = []
         for _, sps in self.service.sps.items():
-            for sp in sps:
-                pospaces = self.service.proofs_of_space.get(sp.challenge_chain_sp, [])
+            for sp in sps.values():
+                proofs = self.service.proofs_of_space.get(sp.challenge_chain_sp, {})
+                pospaces = [(plot_identifier, pospace) for plot_identifier, (pospace, _) in proofs.items()]
                 result.append(
                     {
                         "signage_point": {
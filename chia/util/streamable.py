@@ -126,6 +126,7 @@ def recurse_jsonify(d):
 
 
 PARSE_FUNCTIONS_FOR_STREAMABLE_CLASS = {}
+STREAM_FUNCTIONS_FOR_STREAMABLE_CLASS = {}
 
 
 def streamable(cls: Any):
@@ -158,6 +159,7 @@ def streamable(cls: Any):
     t = type(cls.__name__, (cls1, Streamable), {})
 
     parse_functions = []
+    stream_functions = []
     try:
         fields = cls1.__annotations__  # pylint: disable=no-member
     except Exception:
@@ -165,8 +167,10 @@ def streamable(cls: Any):
 
     for _, f_type in fields.items():
         parse_functions.append(cls.function_to_parse_one_item(f_type))
+        stream_functions.append(cls.function_to_stream_one_item(f_type))
 
     PARSE_FUNCTIONS_FOR_STREAMABLE_CLASS[t] = parse_functions
+    STREAM_FUNCTIONS_FOR_STREAMABLE_CLASS[t] = stream_functions
     return t
 
 
@@ -234,6 +238,42 @@ def parse_str(f: BinaryIO) -> str:
     return bytes.decode(str_read_bytes, "utf-8")
 
 
+def stream_optional(stream_inner_type_f: Callable[[Any, BinaryIO], None], item: Any, f: BinaryIO) -> None:
+    if item is None:
+        f.write(bytes([0]))
+    else:
+        f.write(bytes([1]))
+        stream_inner_type_f(item, f)
+
+
+def stream_bytes(item: Any, f: BinaryIO) -> None:
+    f.write(uint32(len(item)).to_bytes(4, "big"))
+    f.write(item)
+
+
+def stream_list(stream_inner_type_f: Callable[[Any, BinaryIO], None], item: Any, f: BinaryIO) -> None:
+    assert is_type_List(type(item))
+    f.write(uint32(len(item)).to_bytes(4, "big"))
+    for element in item:
+        stream_inner_type_f(element, f)
+
+
+def stream_tuple(list_stream_inner_type_f: List[Callable[[Any, BinaryIO], None]], item: Any, f: BinaryIO) -> None:
+    assert len(item) == len(list_stream_inner_type_f)
+    for stream_f, element in zip(list_stream_inner_type_f, item):
+        stream_f(element, f)
+
+
+def stream_str(item: Any, f: BinaryIO) -> None:
+    str_bytes = item.encode("utf-8")
+    f.write(uint32(len(str_bytes)).to_bytes(4, "big"))
+    f.write(str_bytes)
+
+
+def stream_bool(item: Any, f: BinaryIO) -> None:
+    f.write(int(item).to_bytes(1, "big"))
+
+
 class Streamable:
     @classmethod
     def function_to_parse_one_item(cls: Type[cls.__name__], f_type: Type):  # type: ignore
@@ -267,6 +307,41 @@ class Streamable:
             return parse_str
         raise NotImplementedError(f"Type {f_type} does not have parse")
 
+    @classmethod
+    def function_to_stream_one_item(cls: Type[cls.__name__], f_type: Type):  # type: ignore
+        """
+        This function returns a function taking two arguments `item: Any, f: BinaryIO` that streams
+        a value of the given type. The checks follow the same order as stream_one_item.
+        """
+        inner_type: Type
+        if is_type_SpecificOptional(f_type):
+            inner_type = get_args(f_type)[0]
+            stream_inner_type_f = cls.function_to_stream_one_item(inner_type)
+            return lambda item, f: stream_optional(stream_inner_type_f, item, f)
+        if f_type == bytes:
+            return stream_bytes
+        if hasattr(f_type, "stream"):
+            return lambda item, f: item.stream(f)
+        if hasattr(f_type, "__bytes__"):
+            return lambda item, f: f.write(bytes(item))
+        if is_type_List(f_type):
+            inner_type = get_args(f_type)[0]
+            stream_inner_type_f = cls.function_to_stream_one_item(inner_type)
+            return lambda item, f: stream_list(stream_inner_type_f, item, f)
+        if is_type_Tuple(f_type):
+            inner_types = get_args(f_type)
+            list_stream_inner_type_f = [cls.function_to_stream_one_item(_) for _ in inner_types]
+            return lambda item, f: stream_tuple(list_stream_inner_type_f, item, f)
+        if f_type is str:
+            return stream_str
+        if f_type is bool:
+            return stream_bool
+
+        def stream_not_implemented(item: Any, f: BinaryIO) -> None:
+            raise NotImplementedError(f"can't stream {item}, {f_type}")
+
+        return stream_not_implemented
+
     @classmethod
     def parse(cls: Type[cls.__name__], f: BinaryIO) -> cls.__name__:  # type: ignore
         # Create the object without calling __init__() to avoid unnecessary post-init checks in strictdataclass
@@ -326,8 +401,13 @@ class Streamable:
             fields = self.__annotations__  # pylint: disable=no-member
         except Exception:
             fields = {}
-        for f_name, f_type in fields.items():
-            self.stream_one_item(f_type, getattr(self, f_name), f)
+        stream_functions = STREAM_FUNCTIONS_FOR_STREAMABLE_CLASS.get(type(self))
+        if stream_functions is None:
+            for f_name, f_type in fields.items():
+                self.stream_one_item(f_type, getattr(self, f_name), f)
+            return
+        for f_name, stream_f in zip(fields, stream_functions):
+            stream_f(getattr(self, f_name), f)
 
     def get_hash(self) -> bytes32:
         return bytes32(std_hash(bytes(self)))
@@ -0,0 +1,159 @@
+from typing import List
+
+import pytest
+from blspy import AugSchemeMPL
+
+from chia.farmer.farmer import Farmer
+from chia.farmer.farmer_api import FarmerAPI
+from chia.protocols import farmer_protocol, harvester_protocol
+from chia.protocols.protocol_message_types import ProtocolMessageTypes
+from chia.server.outbound_message import Message, NodeType
+from chia.types.blockchain_format.pool_target import PoolTarget
+from chia.types.blockchain_format.proof_of_space import ProofOfSpace
+from chia.util.bech32m import encode_puzzle_hash
+from chia.util.hash import std_hash
+from chia.util.ints import uint8, uint32, uint64
+from tests.setup_nodes import bt, test_constants
+
+
+class RecordingServer:
+    def __init__(self):
+        self.sent: List[Message] = []
+
+    async def send_to_all(self, messages: List[Message], node_type: NodeType):
+        assert node_type is NodeType.FULL_NODE
+        self.sent.extend(messages)
+
+
+class TestFarmer:
+    @pytest.fixture(scope="function")
+    def farmer(self):
+        # A bare farmer, Farmer._start is not called so no server or periodic cache clearing task is running
+        config = dict(bt.config["farmer"])
+        config_pool = dict(bt.config["pool"])
+        config["xch_target_address"] = encode_puzzle_hash(bt.farmer_ph, "xch")
+        config["pool_public_keys"] = [bytes(pk).hex() for pk in bt.pool_pubkeys]
+        config_pool["xch_target_address"] = encode_puzzle_hash(bt.pool_ph, "xch")
+        farmer = Farmer(bt.root_path, config, config_pool, bt.keychain, test_constants)
+        yield farmer
+        farmer._close()
+
+    @pytest.fixture(scope="function")
+    def farmer_api(self, farmer):
+        farmer.set_server(RecordingServer())
+        return FarmerAPI(farmer)
+
+    def test_cache_eviction(self, farmer):
+        expiry = farmer.constants.SUB_SLOT_TIME_TARGET * 3
+        key_a, key_b, key_c = std_hash(b"a"), std_hash(b"b"), std_hash(b"c")
+
+        farmer.touch_cache(key_a, 0)
+        farmer.touch_cache(key_b, 10)
+        # Touching a key again moves it behind the keys touched in the meantime
+        farmer.touch_cache(key_a, 20)
+        farmer.touch_cache(key_c, 30)
+        farmer.number_of_responses[key_b] += 1
+        farmer.sps[key_b] = {}
+        assert list(farmer.cache_add_time.keys()) == [key_b, key_a, key_c]
+
+        farmer.clear_expired_cache(15 + expiry)
+        assert list(farmer.cache_add_time.keys()) == [key_a, key_c]
+        assert key_b not in farmer.number_of_responses
+        assert key_b not in farmer.sps
+
+        farmer.clear_expired_cache(25 + expiry)
+        assert list(farmer.cache_add_time.keys()) == [key_c]
+
+        farmer.clear_expired_cache(31 + expiry)
+        assert len(farmer.cache_add_time) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("include_taproot", [False, True])
+    @pytest.mark.parametrize("is_sp_signatures", [True, False])
+    async def test_respond_signatures(self, farmer_api, include_taproot: bool, is_sp_signatures: bool):
+        farmer = farmer_api.farmer
+        local_sk = AugSchemeMPL.key_gen(std_hash(b"local key"))
+        local_pk = local_sk.get_g1()
+        farmer_pk = bt.farmer_pk
+        plot_pk = ProofOfSpace.generate_plot_public_key(local_pk, farmer_pk, include_taproot)
+
+        challenge_hash, cc_sp, rc_sp = std_hash(b"challenge"), std_hash(b"cc sp"), std_hash(b"rc sp")
+        quality_string = std_hash(b"quality")
+        # The proof is not checked again in respond_signatures, the stored quality string is used instead
+        pospace = ProofOfSpace(
+            challenge_hash,
+            None if include_taproot else bt.pool_pk,
+            std_hash(b"p2 singleton") if include_taproot else None,
+            plot_pk,
+            uint8(32),
+            bytes(256),
+        )
+        farmer.sps[cc_sp] = {
+            rc_sp: farmer_protocol.NewSignagePoint(
+                challenge_hash, cc_sp, rc_sp, uint64(1), uint64(1000000), uint8(2)
+            )
+        }
+        farmer.proofs_of_space[cc_sp]["plot_1"] = (pospace, quality_string)
+
+        if is_sp_signatures:
+            messages = [cc_sp, rc_sp]
+        else:
+            messages = [std_hash(b"foliage block data"), std_hash(b"foliage transaction block")]
+        response = harvester_protocol.RespondSignatures(
+            "plot_1",
+            challenge_hash,
+            cc_sp,
+            local_pk,
+            farmer_pk,
+            [(message, AugSchemeMPL.sign(local_sk, message, plot_pk)) for message in messages],
+        )
+        await farmer_api.respond_signatures(response)
+
+        sent = farmer.server.sent
+        assert len(sent) == 1
+        if is_sp_signatures:
+            assert sent[0].type == ProtocolMessageTypes.declare_proof_of_space.value
+            declare = farmer_protocol.DeclareProofOfSpace.from_bytes(sent[0].data)
+            assert declare.proof_of_space == pospace
+            assert declare.farmer_puzzle_hash == farmer.farmer_target
+            signatures = [declare.challenge_chain_sp_signature, declare.reward_chain_sp_signature]
+            if include_taproot:
+                assert declare.pool_target is None and declare.pool_signature is None
+            else:
+                assert declare.pool_target == PoolTarget(farmer.pool_target, uint32(0))
+                assert AugSchemeMPL.verify(bt.pool_pk, bytes(declare.pool_target), declare.pool_signature)
+        else:
+            assert sent[0].type == ProtocolMessageTypes.signed_values.value
+            signed_values = farmer_protocol.SignedValues.from_bytes(sent[0].data)
+            assert signed_values.quality_string == quality_string
+            signatures = [signed_values.foliage_block_data_signature, signed_values.foliage_transaction_block_signature]
+        for message, signature in zip(messages, signatures):
+            assert AugSchemeMPL.verify(plot_pk, message, signature)
+
+    @pytest.mark.asyncio
+    async def test_respond_signatures_unknown_farmer_key(self, farmer_api):
+        farmer = farmer_api.farmer
+        local_sk = AugSchemeMPL.key_gen(std_hash(b"local key"))
+        unknown_farmer_pk = AugSchemeMPL.key_gen(std_hash(b"unknown farmer key")).get_g1()
+        assert farmer.get_private_key(unknown_farmer_pk) is None
+        assert farmer.get_private_key(bt.farmer_pk) is not None
+
+        cc_sp, rc_sp = std_hash(b"cc sp"), std_hash(b"rc sp")
+        plot_pk = ProofOfSpace.generate_plot_public_key(local_sk.get_g1(), unknown_farmer_pk)
+        pospace = ProofOfSpace(std_hash(b"challenge"), bt.pool_pk, None, plot_pk, uint8(32), bytes(256))
+        farmer.sps[cc_sp] = {
+            rc_sp: farmer_protocol.NewSignagePoint(
+                std_hash(b"challenge"), cc_sp, rc_sp, uint64(1), uint64(1000000), uint8(2)
+            )
+        }
+        farmer.proofs_of_space[cc_sp]["plot_1"] = (pospace, std_hash(b"quality"))
+        response = harvester_protocol.RespondSignatures(
+            "plot_1",
+            std_hash(b"challenge"),
+            cc_sp,
+            local_sk.get_g1(),
+            unknown_farmer_pk,
+            [(message, AugSchemeMPL.sign(local_sk, message, plot_pk)) for message in [cc_sp, rc_sp]],
+        )
+        await farmer_api.respond_signatures(response)
+        assert len(farmer.server.sent) == 0
@@ -97,6 +97,24 @@ class TestRpc:
             await time_out_assert(5, have_signage_points, True)
             assert (await client.get_signage_point(std_hash(b"2"))) is not None
 
+            # A duplicate signage point is not stored again
+            await farmer_api.new_signage_point(sp)
+            assert len(await client.get_signage_points()) == 1
+
+            # A signage point with the same challenge chain sp but a different reward chain sp is kept alongside
+            sp_2 = farmer_protocol.NewSignagePoint(
+                std_hash(b"1"), std_hash(b"2"), std_hash(b"4"), uint64(1), uint64(1000000), uint8(2)
+            )
+            await farmer_api.new_signage_point(sp_2)
+            signage_points = await client.get_signage_points()
+            assert len(signage_points) == 2
+            for signage_point in signage_points:
+                assert hexstr_to_bytes(signage_point["signage_point"]["challenge_chain_sp"]) == std_hash(b"2")
+            assert [hexstr_to_bytes(s["signage_point"]["reward_chain_sp"]) for s in signage_points] == [
+                std_hash(b"3"),
+                std_hash(b"4"),
+            ]
+
             async def have_plots():
                 return len((await client_2.get_plots())["plots"]) > 0
 
@@ -196,6 +196,24 @@ class TestStreamable(unittest.TestCase):
         with raises(AssertionError):
             TestClassProgram.from_bytes(bytes(program) + b"9")
 
+    def test_stream_functions(self):
+        @dataclass(frozen=True)
+        @streamable
+        class TestClassStream(Streamable):
+            a: uint32
+            b: Optional[uint32]
+            c: List[bytes]
+            d: Tuple[uint8, str]
+            e: bool
+
+        a = TestClassStream(uint32(1), None, [b"\x02"], (uint8(3), "4"), True)  # type: ignore
+        f = io.BytesIO()
+        for f_name, f_type in a.__annotations__.items():
+            a.stream_one_item(f_type, getattr(a, f_name), f)
+
+        assert bytes(a) == f.getvalue()
+        assert bytes(a) == b"\x00\x00\x00\x01\x00\x00\x00\x00\x01\x00\x00\x00\x01\x02\x03\x00\x00\x00\x014\x01"
+
     def test_streamable_empty(self):
         @dataclass(frozen=True)
         @streamable